@@ -1,58 +1,12 @@
 # ----------------------------------------------------------
-# Edmonds-Karp Algorithm for Maximum Flow
+# Maximum Flow: Dinic's Algorithm
 # ----------------------------------------------------------
 # This program finds the maximum flow in a given flow network
 # and displays the flow through each edge as well as the total
 # maximum flow value.
 # ----------------------------------------------------------
 
-from collections import deque
-
-# ---------- Function Definitions ----------
-
-def edmonds_karp(capacity, source, sink):
-    n = len(capacity)
-    residual = [row[:] for row in capacity]
-    parent = [-1] * n
-
-    def bfs():
-        """Find augmenting path using BFS."""
-        for i in range(n):
-            parent[i] = -1
-        queue = deque([source])
-        parent[source] = source
-        while queue:
-            u = queue.popleft()
-            for v in range(n):
-                if parent[v] == -1 and residual[u][v] > 0:
-                    parent[v] = u
-                    queue.append(v)
-                    if v == sink:
-                        return True
-        return False
-
-    max_flow = 0
-    while bfs():
-        # Find bottleneck (minimum capacity in the path)
-        path_flow = float('inf')
-        v = sink
-        while v != source:
-            u = parent[v]
-            path_flow = min(path_flow, residual[u][v])
-            v = u
-
-        # Update residual capacities
-        v = sink
-        while v != source:
-            u = parent[v]
-            residual[u][v] -= path_flow
-            residual[v][u] += path_flow
-            v = u
-
-        max_flow += path_flow
-
-    return residual, max_flow
-
+from maxflow import dinic
 
 # ---------- Example Network ----------
 
@@ -68,23 +22,15 @@ capacity = [
     [0, 0, 0, 0, 0]      # t
 ]
 
-# ---------- Run Edmonds-Karp ----------
-residual, max_flow = edmonds_karp(capacity, 0, 4)
-
-# ---------- Compute Forward Flows ----------
-n = len(capacity)
-forward_flow = [[0] * n for _ in range(n)]
-for u in range(n):
-    for v in range(n):
-        if capacity[u][v] > 0:
-            forward_flow[u][v] = max(0, capacity[u][v] - residual[u][v])
+# ---------- Run Dinic ----------
+forward_flow, max_flow = dinic(capacity, 0, 4)
 
 # ---------- Output ----------
-print("----- Edmonds-Karp Maximum Flow -----\n")
+print("----- Dinic Maximum Flow -----\n")
 print("Forward flow on original edges (flow / capacity):")
-for u in range(n):
-    for v in range(n):
-        if capacity[u][v] > 0:
-            print(f"{names[u]} -> {names[v]} : {forward_flow[u][v]} / {capacity[u][v]}")
+for u, row in forward_flow.items():
+    cap_row = capacity[u]
+    for v, flow in row.items():
+        print(f"{names[u]} -> {names[v]} : {flow} / {cap_row[v]}")
 print()
 print("Total maximum flow from source (s):", max_flow)
@@ -0,0 +1,218 @@
+# ----------------------------------------------------------
+# Maximum Flow Solvers: Dinic's Algorithm and Edmonds-Karp
+# ----------------------------------------------------------
+# Shared by code.py, codeFinal.py and codeNew.py. The augmenting
+# loops run in compiled code, picked at import time from:
+#   1. maxflow_cy  - Cython extension wrapping maxflow_c.c
+#   2. maxflow_c   - the same C loops loaded through ctypes
+#   3. maxflow_nb  - Numba JIT fallback (cached on disk)
+# Build 1 and 2 with: python setup.py build_ext --inplace
+# ----------------------------------------------------------
+
+import ctypes
+import os
+from importlib.machinery import EXTENSION_SUFFIXES
+from types import SimpleNamespace
+
+import numpy as np
+
+NO_LIMIT = np.iinfo(np.int64).max
+
+
+def _build_csr(capacity):
+    """Build paired CSR edge arrays (tail, head, nxt, to, cap)."""
+    n = len(capacity)
+
+    # Build CSR-style adjacency arrays once: edge e and its reverse e ^ 1
+    # are stored side by side, so BFS only scans real (and reverse) edges
+    us, vs = np.nonzero(capacity > 0)
+    m = 2 * len(us)
+    to = np.empty(m, dtype=np.int32)
+    tail = np.empty(m, dtype=np.int32)
+    cap = np.zeros(m, dtype=np.int32)
+    to[0::2], to[1::2] = vs, us
+    tail[0::2], tail[1::2] = us, vs
+    cap[0::2] = capacity[us, vs]
+    # Link edges so each node's neighbors are visited in increasing order
+    order = np.lexsort((to, tail))
+    same_tail = tail[order[1:]] == tail[order[:-1]]
+    nxt = np.full(m, -1, dtype=np.int32)
+    nxt[order[:-1][same_tail]] = order[1:][same_tail]
+    first = np.ones(m, dtype=bool)
+    first[1:] = ~same_tail
+    head = np.full(n, -1, dtype=np.int32)
+    head[tail[order[first]]] = order[first]
+
+    return tail, head, nxt, to, cap
+
+
+def _check_terminals(n, source, sink):
+    """Reject source/sink outside 0..n-1; the compiled loops don't bounds-check."""
+    if not (0 <= source < n and 0 <= sink < n):
+        raise ValueError(f"source and sink must be in range 0..{n - 1}, got {source} and {sink}")
+
+
+def _as_int32_capacity(capacity):
+    """
+    Convert a capacity matrix to int32, raising ValueError unless the
+    conversion is exact (integral values within 0..2**31 - 1).
+    """
+    original = np.asarray(capacity)
+    with np.errstate(invalid="ignore"):
+        converted = original.astype(np.int32)
+    if not np.array_equal(converted, original) or (converted < 0).any():
+        raise ValueError("capacities must be integers in range 0..2**31 - 1")
+    return converted
+
+
+def _edge_flows(us, vs, flows):
+    """
+    Group the flow on each real edge u -> v as {u: {v: flow}}, in the
+    order the edges are given. Opposite flows on antiparallel edges
+    cancel down to the net flow.
+    """
+    raw = {}
+    for u, v, f in zip(us.tolist(), vs.tolist(), flows.tolist()):
+        raw.setdefault(u, {})[v] = f
+    get_row = raw.get
+    no_edges = {}
+    return {
+        u: {v: max(0, f - get_row(v, no_edges).get(u, 0)) for v, f in row.items()}
+        for u, row in raw.items()
+    }
+
+
+# ----------------------------------------------------------
+# Loop Backends
+# ----------------------------------------------------------
+# Every backend exposes the same two loops over paired CSR arrays,
+# each updating cap in place and returning the flow pushed:
+#   edmonds_karp(head, nxt, to, cap, source, sink, limit)
+#   dinic(head, nxt, to, cap, source, sink)
+def _load_ctypes_backend():
+    """Load the compiled maxflow_c library if present, else None."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    for suffix in EXTENSION_SUFFIXES:
+        path = os.path.join(here, "maxflow_c" + suffix)
+        if os.path.exists(path):
+            break
+    else:
+        return None
+
+    lib = ctypes.CDLL(path)
+    i32 = np.ctypeslib.ndpointer(dtype=np.int32, flags="C_CONTIGUOUS")
+    csr_args = [i32, i32, i32, i32, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int]
+    lib.edmonds_karp_csr.argtypes = csr_args + [ctypes.c_longlong]
+    lib.edmonds_karp_csr.restype = ctypes.c_longlong
+    lib.dinic_csr.argtypes = csr_args
+    lib.dinic_csr.restype = ctypes.c_longlong
+
+    def edmonds_karp(head, nxt, to, cap, source, sink, limit):
+        return lib.edmonds_karp_csr(head, nxt, to, cap, len(head), len(to), source, sink, limit)
+
+    def dinic(head, nxt, to, cap, source, sink):
+        return lib.dinic_csr(head, nxt, to, cap, len(head), len(to), source, sink)
+
+    return SimpleNamespace(edmonds_karp=edmonds_karp, dinic=dinic)
+
+
+def _load_backend():
+    try:
+        import maxflow_cy
+        return maxflow_cy
+    except ImportError:
+        pass
+    backend = _load_ctypes_backend()
+    if backend is None:
+        # Only pay for importing Numba when nothing compiled is around
+        import maxflow_nb as backend
+    return backend
+
+
+_backend = _load_backend()
+
+
+def _checked(pushed):
+    if pushed < 0:
+        raise MemoryError("maxflow_c could not allocate scratch buffers")
+    return pushed
+
+
+def _edmonds_karp_loop(head, nxt, to, cap, source, sink, limit):
+    """Run the Edmonds-Karp loop on the selected backend."""
+    return _checked(_backend.edmonds_karp(head, nxt, to, cap, source, sink, limit))
+
+
+def _dinic_loop(head, nxt, to, cap, source, sink):
+    """Run Dinic's phases on the selected backend."""
+    return _checked(_backend.dinic(head, nxt, to, cap, source, sink))
+
+
+def edmonds_karp(capacity, source, sink):
+    """
+    Compute max flow using Edmonds-Karp (BFS-based Ford-Fulkerson).
+    Returns (flows, max_flow), flows as {u: {v: flow}} per real edge.
+    """
+    capacity = _as_int32_capacity(capacity)
+    _check_terminals(capacity.shape[0], source, sink)
+    tail, head, nxt, to, cap = _build_csr(capacity)
+    max_flow = _edmonds_karp_loop(head, nxt, to, cap, source, sink, NO_LIMIT)
+    return _edge_flows(tail[0::2], to[0::2], cap[1::2]), max_flow
+
+
+def dinic(capacity, source, sink):
+    """
+    Compute max flow using Dinic's algorithm (level graph + blocking flow).
+    Returns (flows, max_flow), flows as {u: {v: flow}} per real edge.
+    """
+    capacity = _as_int32_capacity(capacity)
+    _check_terminals(capacity.shape[0], source, sink)
+    tail, head, nxt, to, cap = _build_csr(capacity)
+    max_flow = _dinic_loop(head, nxt, to, cap, source, sink)
+    return _edge_flows(tail[0::2], to[0::2], cap[1::2]), max_flow
+
+
+def solve_delta(prev_flow, prev_capacity, new_capacity, source, sink):
+    """
+    Re-solve after a capacity change, starting from the previous flow.
+    Takes and returns edge flows as {u: {v: flow}}, so consecutive
+    snapshots can chain. Returns (flows, max_flow).
+    """
+    prev_capacity = _as_int32_capacity(prev_capacity)
+    new_capacity = _as_int32_capacity(new_capacity)
+    _check_terminals(new_capacity.shape[0], source, sink)
+
+    # Warm start: carry the previous flow over onto the new capacities.
+    # Edges of both snapshots are kept so removed links can be drained.
+    tail, head, nxt, to, cap = _build_csr(np.maximum(prev_capacity, new_capacity))
+    us, vs = tail[0::2], to[0::2]
+    new_cap = new_capacity[us, vs]
+    cap[1::2] = [prev_flow.get(u, {}).get(v, 0) for u, v in zip(us.tolist(), vs.tolist())]
+    cap[0::2] = np.maximum(0, new_cap - cap[1::2])
+
+    # Cancel flow above a reduced capacity one edge at a time: reroute
+    # the excess from u to v if possible, otherwise return it to the
+    # source and pull it back from the sink
+    for i in np.flatnonzero(cap[1::2] > new_cap):
+        e = 2 * i
+        delta = cap[e + 1] - new_cap[i]
+        if delta <= 0:
+            cap[e] = -delta
+            continue
+        cap[e], cap[e + 1] = 0, new_cap[i]
+
+        u, v = us[i], vs[i]
+        delta -= _edmonds_karp_loop(head, nxt, to, cap, u, v, delta)
+        if delta > 0:
+            if u != source:
+                _edmonds_karp_loop(head, nxt, to, cap, u, source, delta)
+            if v != sink:
+                _edmonds_karp_loop(head, nxt, to, cap, sink, v, delta)
+
+    # Push whatever new capacity allows on top of the repaired flow
+    _dinic_loop(head, nxt, to, cap, source, sink)
+
+    edge_flow = cap[1::2]
+    max_flow = int(edge_flow[us == source].sum() - edge_flow[vs == source].sum())
+    keep = new_cap > 0
+    return _edge_flows(us[keep], vs[keep], edge_flow[keep]), max_flow
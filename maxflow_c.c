@@ -0,0 +1,233 @@
+/* ----------------------------------------------------------
+ * Native CSR max-flow loops for maxflow.py (loaded via ctypes)
+ * ----------------------------------------------------------
+ * Same edge layout as the Python side: edge e and its reverse
+ * e ^ 1 are paired, head[u] / nxt[e] link each node's edges and
+ * -1 ends a list. cap is updated in place. Both functions return
+ * the flow pushed, or -1 if scratch memory cannot be allocated.
+ * ---------------------------------------------------------- */
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef _WIN32
+#define MAXFLOW_API __declspec(dllexport)
+#else
+#define MAXFLOW_API
+#endif
+
+static int has_out_capacity(const int *head, const int *nxt, const int *cap, int u)
+{
+    for (int e = head[u]; e != -1; e = nxt[e])
+        if (cap[e] > 0)
+            return 1;
+    return 0;
+}
+
+MAXFLOW_API long long edmonds_karp_csr(const int *head, const int *nxt, const int *to, int *cap,
+                                       int n, int m, int src, int snk, long long limit)
+{
+    (void)m;
+    if (src == snk)
+        return 0;
+
+    int words = (n + 63) >> 6;
+    /* pred_edge[v] enters v on the source side of the search,
+     * succ_edge[v] leaves v towards the sink on the sink side */
+    int *pred_edge = malloc(sizeof(int) * n);
+    int *succ_edge = malloc(sizeof(int) * n);
+    int *dist_f = malloc(sizeof(int) * n);
+    int *dist_b = malloc(sizeof(int) * n);
+    int *queue_f = malloc(sizeof(int) * n);
+    int *queue_b = malloc(sizeof(int) * n);
+    uint64_t *seen_f = malloc(sizeof(uint64_t) * words);
+    uint64_t *seen_b = malloc(sizeof(uint64_t) * words);
+    long long max_flow = 0;
+
+    if (!pred_edge || !succ_edge || !dist_f || !dist_b ||
+        !queue_f || !queue_b || !seen_f || !seen_b) {
+        max_flow = -1;
+        goto done;
+    }
+
+    while (max_flow < limit && has_out_capacity(head, nxt, cap, src)) {
+        /* Find a shortest augmenting path, searching from both ends */
+        memset(seen_f, 0, sizeof(uint64_t) * words);
+        memset(seen_b, 0, sizeof(uint64_t) * words);
+        seen_f[src >> 6] |= (uint64_t)1 << (src & 63);
+        seen_b[snk >> 6] |= (uint64_t)1 << (snk & 63);
+        dist_f[src] = 0;
+        dist_b[snk] = 0;
+        queue_f[0] = src;
+        queue_b[0] = snk;
+        int fh = 0, ft = 1, bh = 0, bt = 1, meet = -1;
+        while (meet == -1 && fh < ft && bh < bt) {
+            /* Finish the whole level so the meeting vertex on the
+             * shortest path wins over other vertices met in it */
+            int best = n;
+            if (ft - fh <= bt - bh) {
+                /* Forward level: residual edges u -> v */
+                for (int level_end = ft; fh < level_end;) {
+                    int u = queue_f[fh++];
+                    for (int e = head[u]; e != -1; e = nxt[e]) {
+                        int v = to[e];
+                        uint64_t bit = (uint64_t)1 << (v & 63);
+                        if (cap[e] > 0 && !(seen_f[v >> 6] & bit)) {
+                            seen_f[v >> 6] |= bit;
+                            pred_edge[v] = e;
+                            dist_f[v] = dist_f[u] + 1;
+                            queue_f[ft++] = v;
+                            if ((seen_b[v >> 6] & bit) && dist_b[v] < best) {
+                                best = dist_b[v];
+                                meet = v;
+                            }
+                        }
+                    }
+                }
+            } else {
+                /* Backward level: residual edges x -> y, found as the
+                 * reverse partners of y's own edges */
+                for (int level_end = bt; bh < level_end;) {
+                    int y = queue_b[bh++];
+                    for (int e = head[y]; e != -1; e = nxt[e]) {
+                        int x = to[e];
+                        uint64_t bit = (uint64_t)1 << (x & 63);
+                        if (cap[e ^ 1] > 0 && !(seen_b[x >> 6] & bit)) {
+                            seen_b[x >> 6] |= bit;
+                            succ_edge[x] = e ^ 1;
+                            dist_b[x] = dist_b[y] + 1;
+                            queue_b[bt++] = x;
+                            if ((seen_f[x >> 6] & bit) && dist_f[x] < best) {
+                                best = dist_f[x];
+                                meet = x;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        if (meet == -1)
+            break;
+
+        /* Find bottleneck over both halves of the path */
+        long long path_flow = limit - max_flow;
+        for (int v = meet; v != src; v = to[pred_edge[v] ^ 1])
+            if (cap[pred_edge[v]] < path_flow)
+                path_flow = cap[pred_edge[v]];
+        for (int v = meet; v != snk; v = to[succ_edge[v]])
+            if (cap[succ_edge[v]] < path_flow)
+                path_flow = cap[succ_edge[v]];
+
+        /* Update residuals (e ^ 1 is the paired reverse edge) */
+        for (int v = meet; v != src; v = to[pred_edge[v] ^ 1]) {
+            cap[pred_edge[v]] -= (int)path_flow;
+            cap[pred_edge[v] ^ 1] += (int)path_flow;
+        }
+        for (int v = meet; v != snk; v = to[succ_edge[v]]) {
+            cap[succ_edge[v]] -= (int)path_flow;
+            cap[succ_edge[v] ^ 1] += (int)path_flow;
+        }
+
+        max_flow += path_flow;
+    }
+
+done:
+    free(pred_edge);
+    free(succ_edge);
+    free(dist_f);
+    free(dist_b);
+    free(queue_f);
+    free(queue_b);
+    free(seen_f);
+    free(seen_b);
+    return max_flow;
+}
+
+MAXFLOW_API long long dinic_csr(const int *head, const int *nxt, const int *to, int *cap,
+                                int n, int m, int src, int snk)
+{
+    (void)m;
+    if (src == snk)
+        return 0;
+
+    int *level = malloc(sizeof(int) * n);
+    int *it = malloc(sizeof(int) * n);
+    int *queue = malloc(sizeof(int) * n);
+    int *path = malloc(sizeof(int) * n);
+    long long max_flow = 0;
+
+    if (!level || !it || !queue || !path) {
+        max_flow = -1;
+        goto done;
+    }
+
+    while (has_out_capacity(head, nxt, cap, src)) {
+        /* Build the level graph with BFS from the source */
+        for (int i = 0; i < n; i++)
+            level[i] = -1;
+        level[src] = 0;
+        queue[0] = src;
+        int qh = 0, qt = 1;
+        while (qh < qt) {
+            int u = queue[qh++];
+            for (int e = head[u]; e != -1; e = nxt[e]) {
+                int v = to[e];
+                if (level[v] == -1 && cap[e] > 0) {
+                    level[v] = level[u] + 1;
+                    queue[qt++] = v;
+                }
+            }
+        }
+        if (level[snk] == -1)
+            break;
+
+        /* Push a blocking flow with an iterative DFS; it[u] is the next
+         * edge of u still worth trying in this phase */
+        memcpy(it, head, sizeof(int) * n);
+        int depth = 0, u = src;
+        for (;;) {
+            if (u == snk) {
+                int pushed = cap[path[0]];
+                for (int i = 1; i < depth; i++)
+                    if (cap[path[i]] < pushed)
+                        pushed = cap[path[i]];
+                for (int i = 0; i < depth; i++) {
+                    cap[path[i]] -= pushed;
+                    cap[path[i] ^ 1] += pushed;
+                }
+                max_flow += pushed;
+
+                /* Resume from the tail of the first saturated edge */
+                depth = 0;
+                while (cap[path[depth]] > 0)
+                    depth++;
+                u = to[path[depth] ^ 1];
+                continue;
+            }
+
+            int e = it[u];
+            while (e != -1 && (cap[e] == 0 || level[to[e]] != level[u] + 1))
+                e = nxt[e];
+            it[u] = e;
+
+            if (e != -1) {
+                path[depth++] = e;
+                u = to[e];
+            } else if (u == src) {
+                break;
+            } else {
+                /* Dead end: retreat and skip the edge that led here */
+                u = to[path[--depth] ^ 1];
+                it[u] = nxt[it[u]];
+            }
+        }
+    }
+
+done:
+    free(level);
+    free(it);
+    free(queue);
+    free(path);
+    return max_flow;
+}
@@ -0,0 +1,226 @@
+# ----------------------------------------------------------
+# Numba Backend for the CSR max-flow loops
+# ----------------------------------------------------------
+# Fallback used by maxflow.py when neither compiled extension from
+# setup.py is available. The loops are compiled against fixed
+# signatures and cached on disk, so later runs skip type inference
+# and codegen.
+# ----------------------------------------------------------
+
+import numpy as np
+from numba import njit
+
+# (head, nxt, to, cap, source, sink[, limit]) -> flow pushed
+_CSR_ARGS = "int32[::1], int32[::1], int32[::1], int32[::1], int64, int64"
+_EK_SIG = f"int64({_CSR_ARGS}, int64)"
+_DINIC_SIG = f"int64({_CSR_ARGS})"
+
+
+@njit("boolean(int32[::1], int32[::1], int32[::1], int64)", cache=True)
+def _has_out_capacity(head, nxt, cap, u):
+    """Check whether any edge leaving u still has residual capacity."""
+    e = head[u]
+    while e != -1:
+        if cap[e] > 0:
+            return True
+        e = nxt[e]
+    return False
+
+
+@njit(_EK_SIG, cache=True)
+def edmonds_karp(head, nxt, to, cap, source, sink, limit):
+    """
+    Run the Edmonds-Karp augmenting loop on CSR edge arrays, stopping
+    once limit units have been pushed. Each shortest augmenting path is
+    found by a bidirectional BFS that grows the smaller frontier.
+    Updates cap in place and returns the flow pushed.
+    """
+    n = head.shape[0]
+    if source == sink:
+        return 0
+    # pred_edge[v] enters v on the source side of the search,
+    # succ_edge[v] leaves v towards the sink on the sink side
+    pred_edge = np.empty(n, dtype=np.int32)
+    succ_edge = np.empty(n, dtype=np.int32)
+    dist_f = np.empty(n, dtype=np.int32)
+    dist_b = np.empty(n, dtype=np.int32)
+    queue_f = np.empty(n, dtype=np.int32)
+    queue_b = np.empty(n, dtype=np.int32)
+    # Visited sets packed 64 vertices per word, so the per-BFS reset
+    # clears n / 64 words instead of whole per-vertex arrays
+    words = (n + 63) >> 6
+    seen_f = np.zeros(words, dtype=np.uint64)
+    seen_b = np.zeros(words, dtype=np.uint64)
+
+    max_flow = 0
+    while max_flow < limit and _has_out_capacity(head, nxt, cap, source):
+        # Find a shortest augmenting path, searching from both ends
+        seen_f[:] = 0
+        seen_b[:] = 0
+        seen_f[source >> 6] |= np.uint64(1) << np.uint64(source & 63)
+        seen_b[sink >> 6] |= np.uint64(1) << np.uint64(sink & 63)
+        dist_f[source] = 0
+        dist_b[sink] = 0
+        queue_f[0] = source
+        queue_b[0] = sink
+        fh, ft, bh, bt = 0, 1, 0, 1
+        meet = -1
+        while meet == -1 and fh < ft and bh < bt:
+            # Finish the whole level so the meeting vertex on the
+            # shortest path wins over other vertices met in it
+            best = n
+            if ft - fh <= bt - bh:
+                # Forward level: residual edges u -> v
+                level_end = ft
+                while fh < level_end:
+                    u = queue_f[fh]
+                    fh += 1
+                    e = head[u]
+                    while e != -1:
+                        v = to[e]
+                        bit = np.uint64(1) << np.uint64(v & 63)
+                        if cap[e] > 0 and (seen_f[v >> 6] & bit) == 0:
+                            seen_f[v >> 6] |= bit
+                            pred_edge[v] = e
+                            dist_f[v] = dist_f[u] + 1
+                            queue_f[ft] = v
+                            ft += 1
+                            if (seen_b[v >> 6] & bit) != 0 and dist_b[v] < best:
+                                best = dist_b[v]
+                                meet = v
+                        e = nxt[e]
+            else:
+                # Backward level: residual edges x -> y, found as the
+                # reverse partners of y's own edges
+                level_end = bt
+                while bh < level_end:
+                    y = queue_b[bh]
+                    bh += 1
+                    e = head[y]
+                    while e != -1:
+                        x = to[e]
+                        bit = np.uint64(1) << np.uint64(x & 63)
+                        if cap[e ^ 1] > 0 and (seen_b[x >> 6] & bit) == 0:
+                            seen_b[x >> 6] |= bit
+                            succ_edge[x] = e ^ 1
+                            dist_b[x] = dist_b[y] + 1
+                            queue_b[bt] = x
+                            bt += 1
+                            if (seen_f[x >> 6] & bit) != 0 and dist_f[x] < best:
+                                best = dist_f[x]
+                                meet = x
+                        e = nxt[e]
+        if meet == -1:
+            break
+
+        # Find bottleneck over both halves of the path
+        path_flow = limit - max_flow
+        v = meet
+        while v != source:
+            e = pred_edge[v]
+            if cap[e] < path_flow:
+                path_flow = cap[e]
+            v = to[e ^ 1]
+        v = meet
+        while v != sink:
+            e = succ_edge[v]
+            if cap[e] < path_flow:
+                path_flow = cap[e]
+            v = to[e]
+
+        # Update residuals (e ^ 1 is the paired reverse edge)
+        v = meet
+        while v != source:
+            e = pred_edge[v]
+            cap[e] -= path_flow
+            cap[e ^ 1] += path_flow
+            v = to[e ^ 1]
+        v = meet
+        while v != sink:
+            e = succ_edge[v]
+            cap[e] -= path_flow
+            cap[e ^ 1] += path_flow
+            v = to[e]
+
+        max_flow += path_flow
+
+    return max_flow
+
+
+@njit(_DINIC_SIG, cache=True)
+def dinic(head, nxt, to, cap, source, sink):
+    """
+    Run Dinic's phases on CSR edge arrays.
+    Updates cap in place and returns the max flow value.
+    """
+    n = head.shape[0]
+    if source == sink:
+        return 0
+    level = np.full(n, -1, dtype=np.int32)
+    it = np.empty(n, dtype=np.int32)
+    queue = np.empty(n, dtype=np.int32)
+    path = np.empty(n, dtype=np.int32)
+
+    max_flow = 0
+    while _has_out_capacity(head, nxt, cap, source):
+        # Build the level graph with BFS from the source
+        level[:] = -1
+        level[source] = 0
+        queue[0] = source
+        qh, qt = 0, 1
+        while qh < qt:
+            u = queue[qh]
+            qh += 1
+            e = head[u]
+            while e != -1:
+                v = to[e]
+                if level[v] == -1 and cap[e] > 0:
+                    level[v] = level[u] + 1
+                    queue[qt] = v
+                    qt += 1
+                e = nxt[e]
+        if level[sink] == -1:
+            break
+
+        # Push a blocking flow with an iterative DFS; it[u] is the next
+        # edge of u still worth trying in this phase
+        it[:] = head
+        depth = 0
+        u = source
+        while True:
+            if u == sink:
+                pushed = cap[path[0]]
+                for i in range(1, depth):
+                    if cap[path[i]] < pushed:
+                        pushed = cap[path[i]]
+                for i in range(depth):
+                    e = path[i]
+                    cap[e] -= pushed
+                    cap[e ^ 1] += pushed
+                max_flow += pushed
+
+                # Resume from the tail of the first saturated edge
+                depth = 0
+                while cap[path[depth]] > 0:
+                    depth += 1
+                u = to[path[depth] ^ 1]
+                continue
+
+            e = it[u]
+            while e != -1 and (cap[e] == 0 or level[to[e]] != level[u] + 1):
+                e = nxt[e]
+            it[u] = e
+
+            if e != -1:
+                path[depth] = e
+                depth += 1
+                u = to[e]
+            elif u == source:
+                break
+            else:
+                # Dead end: retreat and skip the edge that led here
+                depth -= 1
+                u = to[path[depth] ^ 1]
+                it[u] = nxt[it[u]]
+
+    return max_flow
@@ -0,0 +1,45 @@
+# ----------------------------------------------------------
+# Builds the optional native max-flow loops used by maxflow.py
+#   python setup.py build_ext --inplace
+# maxflow_cy needs Cython; maxflow_c is built on non-Windows.
+# ----------------------------------------------------------
+
+import os
+
+from setuptools import Extension, setup
+from setuptools.command.build_ext import build_ext
+
+# Only GCC-style compilers understand these
+GCC_COMPILE_ARGS = ["-O3", "-march=native"]
+
+
+class BuildExt(build_ext):
+    def build_extensions(self):
+        if self.compiler.compiler_type in ("unix", "mingw32", "cygwin"):
+            for ext in self.extensions:
+                ext.extra_compile_args = GCC_COMPILE_ARGS
+        super().build_extensions()
+
+
+# maxflow_c is a ctypes library built as an extension module. MSVC
+# links extensions with /EXPORT:PyInit_maxflow_c, which it does not
+# define, so it is skipped on Windows; maxflow_cy covers it there.
+ext_modules = []
+if os.name != "nt":
+    ext_modules.append(Extension("maxflow_c", ["maxflow_c.c"]))
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    pass
+else:
+    ext_modules += cythonize(
+        [Extension("maxflow_cy", ["maxflow_cy.pyx"])],
+        compiler_directives={"language_level": 3},
+    )
+
+setup(
+    name="maxflow-c",
+    ext_modules=ext_modules,
+    cmdclass={"build_ext": BuildExt},
+)
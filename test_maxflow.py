@@ -0,0 +1,197 @@
+# ----------------------------------------------------------
+# Tests for maxflow.py and its loop backends
+#   python -m unittest test_maxflow
+# Each available backend (maxflow_nb, ctypes maxflow_c, maxflow_cy)
+# is checked against a plain-Python Edmonds-Karp on random graphs.
+# ----------------------------------------------------------
+
+import random
+import unittest
+from collections import deque
+
+import numpy as np
+
+import maxflow
+
+TRIALS = 500
+
+
+def reference_max_flow(capacity, source, sink):
+    """Textbook dense-matrix Edmonds-Karp, kept deliberately simple."""
+    n = len(capacity)
+    residual = [row[:] for row in capacity]
+    max_flow = 0
+    while True:
+        parent = [-1] * n
+        parent[source] = source
+        queue = deque([source])
+        while queue and parent[sink] == -1:
+            u = queue.popleft()
+            for v in range(n):
+                if parent[v] == -1 and residual[u][v] > 0:
+                    parent[v] = u
+                    queue.append(v)
+        if parent[sink] == -1:
+            return max_flow
+        path_flow = float("inf")
+        v = sink
+        while v != source:
+            path_flow = min(path_flow, residual[parent[v]][v])
+            v = parent[v]
+        v = sink
+        while v != source:
+            residual[parent[v]][v] -= path_flow
+            residual[v][parent[v]] += path_flow
+            v = parent[v]
+        max_flow += path_flow
+
+
+def random_network(rng):
+    n = rng.randint(2, 9)
+    density = rng.random()
+    capacity = [
+        [rng.randint(1, 20) if i != j and rng.random() < density else 0 for j in range(n)]
+        for i in range(n)
+    ]
+    source, sink = rng.sample(range(n), 2)
+    return capacity, source, sink
+
+
+def load_backends():
+    backends = {}
+    try:
+        import maxflow_nb
+        backends["numba"] = maxflow_nb
+    except ImportError:
+        pass
+    ctypes_backend = maxflow._load_ctypes_backend()
+    if ctypes_backend is not None:
+        backends["ctypes"] = ctypes_backend
+    try:
+        import maxflow_cy
+        backends["cython"] = maxflow_cy
+    except ImportError:
+        pass
+    return backends
+
+
+class BackendTest(unittest.TestCase):
+    def check_residual(self, tail, to, cap0, cap, n, source, sink, value):
+        """cap must be a valid residual of cap0 carrying value from source to sink."""
+        self.assertTrue((cap >= 0).all())
+        # Each pair keeps its original capacity split between e and e ^ 1
+        np.testing.assert_array_equal(cap[0::2] + cap[1::2], cap0[0::2] + cap0[1::2])
+        excess = np.zeros(n, dtype=np.int64)
+        np.add.at(excess, to[0::2], cap[1::2])
+        np.subtract.at(excess, tail[0::2], cap[1::2])
+        expected = np.zeros(n, dtype=np.int64)
+        expected[sink], expected[source] = value, -value
+        np.testing.assert_array_equal(excess, expected)
+
+    def test_backends_match_reference(self):
+        backends = load_backends()
+        for name, backend in backends.items():
+            rng = random.Random(1)
+            for _ in range(TRIALS):
+                capacity, source, sink = random_network(rng)
+                n = len(capacity)
+                expected = reference_max_flow(capacity, source, sink)
+                tail, head, nxt, to, cap0 = maxflow._build_csr(np.asarray(capacity, dtype=np.int32))
+
+                with self.subTest(backend=name, loop="dinic", capacity=capacity, s=source, t=sink):
+                    cap = cap0.copy()
+                    value = backend.dinic(head, nxt, to, cap, source, sink)
+                    self.assertEqual(value, expected)
+                    self.check_residual(tail, to, cap0, cap, n, source, sink, value)
+
+                with self.subTest(backend=name, loop="edmonds_karp", capacity=capacity, s=source, t=sink):
+                    cap = cap0.copy()
+                    value = backend.edmonds_karp(head, nxt, to, cap, source, sink, maxflow.NO_LIMIT)
+                    self.assertEqual(value, expected)
+                    self.check_residual(tail, to, cap0, cap, n, source, sink, value)
+
+                    limit = rng.randint(0, 25)
+                    cap = cap0.copy()
+                    value = backend.edmonds_karp(head, nxt, to, cap, source, sink, limit)
+                    self.assertEqual(value, min(limit, expected))
+                    self.check_residual(tail, to, cap0, cap, n, source, sink, value)
+
+
+class SolverTest(unittest.TestCase):
+    def check_flow(self, flows, capacity, source, sink, value):
+        n = len(capacity)
+        excess = [0] * n
+        for u, row in flows.items():
+            for v, f in row.items():
+                self.assertGreater(capacity[u][v], 0)
+                self.assertTrue(0 <= f <= capacity[u][v])
+                excess[u] -= f
+                excess[v] += f
+        for x in range(n):
+            if x not in (source, sink):
+                self.assertEqual(excess[x], 0)
+        self.assertEqual(excess[sink], value)
+
+    def test_solvers_match_reference(self):
+        rng = random.Random(2)
+        for _ in range(TRIALS):
+            capacity, source, sink = random_network(rng)
+            expected = reference_max_flow(capacity, source, sink)
+            for solve in (maxflow.dinic, maxflow.edmonds_karp):
+                with self.subTest(solver=solve.__name__, capacity=capacity, s=source, t=sink):
+                    flows, value = solve(capacity, source, sink)
+                    self.assertEqual(value, expected)
+                    self.check_flow(flows, capacity, source, sink, value)
+
+    def test_solve_delta_matches_cold_dinic(self):
+        rng = random.Random(3)
+        for _ in range(TRIALS):
+            prev, source, sink = random_network(rng)
+            n = len(prev)
+            # Change a few links: some shrink, grow, vanish or appear
+            new = [row[:] for row in prev]
+            for _ in range(rng.randint(1, 4)):
+                u, v = rng.sample(range(n), 2)
+                new[u][v] = max(0, new[u][v] + rng.randint(-20, 20))
+
+            prev_flow, _ = maxflow.dinic(prev, source, sink)
+            with self.subTest(prev=prev, new=new, s=source, t=sink):
+                flows, value = maxflow.solve_delta(prev_flow, prev, new, source, sink)
+                self.assertEqual(value, maxflow.dinic(new, source, sink)[1])
+                self.check_flow(flows, new, source, sink, value)
+
+    def test_rejects_out_of_range_terminals(self):
+        capacity = [[0, 3, 0], [0, 0, 2], [0, 0, 0]]
+        for source, sink in ((0, 7), (0, -1), (-1, 2), (3, 0)):
+            for solve in (maxflow.dinic, maxflow.edmonds_karp):
+                with self.assertRaises(ValueError):
+                    solve(capacity, source, sink)
+            with self.assertRaises(ValueError):
+                maxflow.solve_delta({}, capacity, capacity, source, sink)
+
+    def test_rejects_inexact_capacities(self):
+        cases = (
+            [[0, 0.9], [0, 0]],
+            [[0, 2.5], [0, 0]],
+            [[0, -1], [0, 0]],
+            np.array([[0, 2**32 + 7], [0, 0]], dtype=np.int64),
+            np.array([[0, 3e9], [0, 0]]),
+            np.array([[0, np.nan], [0, 0]]),
+        )
+        valid = [[0, 1], [0, 0]]
+        for capacity in cases:
+            with self.subTest(capacity=capacity):
+                for solve in (maxflow.dinic, maxflow.edmonds_karp):
+                    with self.assertRaises(ValueError):
+                        solve(capacity, 0, 1)
+                with self.assertRaises(ValueError):
+                    maxflow.solve_delta({}, valid, capacity, 0, 1)
+                with self.assertRaises(ValueError):
+                    maxflow.solve_delta({}, capacity, valid, 0, 1)
+        # Integral floats and wide integer dtypes are fine when exact
+        for capacity in ([[0, 2.0], [0, 0]], np.array([[0, 2**31 - 1], [0, 0]], dtype=np.int64)):
+            self.assertEqual(maxflow.dinic(capacity, 0, 1)[1], int(np.asarray(capacity)[0, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()